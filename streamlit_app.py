@@ -4,8 +4,10 @@ import json
 from datetime import date, datetime, timedelta
 import hashlib
 import random
+import numpy as np
 import pandas as pd
 import io
+from dateutil.easter import easter
 
 st.set_page_config(page_title="Planning Médical - Planning des Médecins", layout="centered")
 st.title("🩺 Planning des Médecins")
@@ -28,6 +30,52 @@ def couleur_pour_nom(nom):
     h = hashlib.md5(nom.encode()).hexdigest()
     return f"#{h[:6]}"
 
+# Jours fériés légaux en France (calculés localement, Pâques via dateutil)
+def jours_feries_fr(annee):
+    paques = easter(annee)
+    return {
+        date(annee, 1, 1): "Jour de l'an",
+        paques + timedelta(days=1): "Lundi de Pâques",
+        date(annee, 5, 1): "Fête du Travail",
+        date(annee, 5, 8): "Victoire 1945",
+        paques + timedelta(days=39): "Ascension",
+        paques + timedelta(days=50): "Lundi de Pentecôte",
+        date(annee, 7, 14): "Fête nationale",
+        date(annee, 8, 15): "Assomption",
+        date(annee, 11, 1): "Toussaint",
+        date(annee, 11, 11): "Armistice",
+        date(annee, 12, 25): "Noël",
+    }
+
+# Table calendrier : une ligne par jour de l'horizon, calculée une seule fois
+# (générateur, blocs et affichage lisent tous cette table)
+@st.cache_data(max_entries=8)  # horizons glissants depuis date.today()
+def calendrier(debut, fin):
+    jours = pd.date_range(debut, fin, freq="D")
+    iso = jours.isocalendar()
+    feries = {}
+    for annee in range(debut.year, fin.year + 1):
+        feries.update(jours_feries_fr(annee))
+    cal = pd.DataFrame({
+        "date": jours.date,
+        "ordinal": debut.toordinal() + np.arange(len(jours)),
+        "annee": jours.year,
+        "mois": jours.month,
+        "jour": jours.day,
+        "jour_semaine": jours.weekday,  # 0 = lundi
+        "annee_iso": iso["year"].to_numpy(dtype=int),
+        "semaine_iso": iso["week"].to_numpy(dtype=int),
+    })
+    # Période A/B pour l'équilibrage des WE :
+    # A = 21 avril → 31 octobre ; B = 1er novembre → 20 avril (rattachée à l'année de novembre)
+    md = cal["mois"] * 100 + cal["jour"]
+    cal["periode"] = np.where((md >= 421) & (md <= 1031), "A", "B")
+    cal["periode_annee"] = np.where(md <= 420, cal["annee"] - 1, cal["annee"])
+    cal["ferie_nom"] = [feries.get(d, "") for d in cal["date"]]
+    cal["ferie"] = cal["ferie_nom"] != ""
+    cal["ouvre"] = (cal["jour_semaine"] < 5) & ~cal["ferie"]
+    return cal
+
 # Charger les données
 try:
     with open(DATA_FILE, "r", encoding="utf-8") as f:
@@ -71,9 +119,18 @@ def assign_roles(day):
 def assign_roles_smart(start_date, weeks=52, seed=42):
     rnd = random.Random(seed)
 
-    # --- Fenêtre de planification ---
-    jours = [start_date + timedelta(days=i) for i in range(weeks * 7)]
-    jours_ouvres = [d for d in jours if d.weekday() < 5]
+    # --- Fenêtre de planification (table calendrier) ---
+    cal = calendrier(start_date, start_date + timedelta(days=weeks * 7 - 1))
+    jours = cal["date"].tolist()
+    jours_ouvres = cal.loc[cal["ouvre"], "date"].tolist()  # hors week-ends et jours fériés
+    # semaines ISO dans l'ordre chronologique : jours ouvrés (HDM) ;
+    # lundi→vendredi fériés compris (Hospit : le service reste couvert les jours fériés)
+    semaines_ouvrees = [g["date"].tolist() for _, g in
+                        cal[cal["ouvre"]].groupby(["annee_iso", "semaine_iso"], sort=True)]
+    semaines_hospit = [g["date"].tolist() for _, g in
+                       cal[cal["jour_semaine"] < 5].groupby(["annee_iso", "semaine_iso"], sort=True)]
+    semaine_de = dict(zip(jours, zip(cal["annee_iso"].tolist(), cal["semaine_iso"].tolist())))
+    jours_hospit = [d for sem in semaines_hospit for d in sem]
 
     # --- Rôles en semaine & week-end ---
     ROLES_JOUR = ["Hospit1", "Hospit2", "HDL1", "HDL2", "HDM1", "HDM2"]
@@ -112,21 +169,11 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
                                         for d in m.get("weekends_souhaites", []))
                           for m in data['medecins']}
 
-    # --- Helpers période A/B pour l'équilibrage des WE ---
+    # --- Helpers période A/B pour l'équilibrage des WE (lus dans la table) ---
+    periodes = dict(zip(jours, zip(cal["periode"].tolist(), cal["periode_annee"].tolist())))
+
     def periode_tag(d):
-        y = d.year
-        A_start = date(y, 5, 1)
-        A_end   = date(y, 10, 31)
-        B1_start= date(y, 11, 1)
-        B1_end  = date(y+1, 4, 20)
-        # samedi considéré
-        if A_start <= d <= A_end:
-            return ("A", y)
-        if d >= B1_start:
-            return ("B", y)
-        if d <= date(y, 4, 20):
-            return ("B", y-1)
-        return ("A", y)  # fallback
+        return periodes[d]
 
     # --- Compteurs pour équilibrages ---
     count_role_year = {m: {"Hospit":0, "HDM":0, "HDL":0, "Consult":0} for m in medecins}
@@ -136,11 +183,11 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
     # --- Fonctions contraintes ---
     def encadre_vacances(m, saturday):
         # Interdit de travailler le week-end qui touche directement une plage de vacances
-        sunday = saturday + timedelta(days=1)
+        week_end = (saturday, saturday + timedelta(days=1))
         for (d1, d2) in vac_spans[m]:
-            if saturday == d1 - timedelta(days=1):  # veille de vacs
+            if d1 - timedelta(days=1) in week_end:  # veille de vacs
                 return True
-            if sunday == d2 + timedelta(days=1):    # lendemain de vacs
+            if d2 + timedelta(days=1) in week_end:  # lendemain de vacs
                 return True
         return False
 
@@ -168,15 +215,14 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
         return len(s) >= 2
 
     # --- 1) Affectation des week-ends (équilibrage A/B) ---
-    saturdays = [d for d in jours if d.weekday() == 5]
+    samedis = cal[cal["jour_semaine"] == 5]
+    saturdays = samedis["date"].tolist()
     # Cibles d'équilibre : on prend #WE dans la période / nb médecins
     # (approx : on vise une répartition homogène ; ajusté par la sélection dynamique)
     target_we = defaultdict(lambda: {m:0 for m in medecins})
-    for sat in saturdays:
-        tag = periode_tag(sat)
-        target_we[tag]  # lazy creation
-    for tag in target_we.keys():
-        nb_we = sum(1 for sat in saturdays if periode_tag(sat) == tag)
+    nb_we_par_periode = samedis.groupby(["periode", "periode_annee"]).size()
+    for (p, annee), nb_we in nb_we_par_periode.items():
+        tag = (p, int(annee))
         base = nb_we / max(len(medecins),1)
         for m in medecins:
             target_we[tag][m] = base
@@ -229,27 +275,19 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
         count_we_period[m_hosp][tag] += 1
 
     # --- 2) Blocks en semaine pour Hospit, puis HDM (priorité à Hospit) ---
-    def bloc_iter(jours_base, bloc_semaines, bloc_semaines_alt=None):
-        # génère des blocs de k semaines (ouvrées), k = bloc_semaines (ou alt si fourni et nécessaire)
+    def bloc_iter(semaines, bloc_semaines, bloc_semaines_alt=None):
+        # génère des blocs de k semaines ISO prises dans `semaines` (choisies par l'appelant :
+        # lundi→vendredi fériés compris pour Hospit, jours ouvrés seulement pour HDM),
+        # k = bloc_semaines, ou alt si cela évite un reliquat trop court en fin d'horizon
         idx = 0
-        while idx < len(jours_base):
-            # prend un bloc d'environ k semaines ouvrées
+        while idx < len(semaines):
             k = bloc_semaines
-            bloc = []
-            dcount = 0
-            j = idx
-            while j < len(jours_base) and dcount < 5*bloc_semaines:
-                d = jours_base[j]
-                bloc.append(d)
-                dcount += 1
-                j += 1
-            if bloc_semaines_alt and len(bloc) < 5*bloc_semaines and (j+5 <= len(jours_base)):
-                # on “étire” à l’alternative si possible (2→3 semaines pour Hospit, ou 2→3/1 pour HDM)
-                extra = min(5*(bloc_semaines_alt-bloc_semaines), len(jours_base)-j)
-                bloc.extend(jours_base[j:j+extra])
-                j += extra
-            yield bloc
-            idx = j
+            reste = len(semaines) - (idx + k)
+            if bloc_semaines_alt and 0 < reste <= bloc_semaines_alt - bloc_semaines:
+                # on “étire” à l’alternative (2→3 semaines pour Hospit / HDM)
+                k = bloc_semaines_alt
+            yield [d for sem in semaines[idx:idx + k] for d in sem]
+            idx += k
 
     def choose_for_role(role, bloc, avoid_pairs, prio_key):
         # prio_key: "Hospit" | "HDM" | "HDL"
@@ -283,10 +321,22 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
         candidats.sort(key=sc)
         return candidats[0]
 
+    def titulaires_voisins(bloc, jours_famille, roles):
+        # médecins tenant un rôle de la famille (Hospit1/2 ou HDM1/2) juste avant ou juste après
+        # le bloc : les reprendre ferait un bloc continu de plus de 3 semaines
+        rang = jours_famille.index(bloc[0])
+        voisins = set()
+        for i in (rang - 1, rang + len(bloc)):
+            if 0 <= i < len(jours_famille):
+                js = str(jours_famille[i])
+                voisins.update(planning.get(js, {}).get(r) for r in roles)
+        voisins.discard(None)
+        return voisins
+
     # Hospit: blocs 2–3 semaines
     for role in ["Hospit1","Hospit2"]:
-        for bloc in bloc_iter(jours_ouvres, bloc_semaines=2, bloc_semaines_alt=3):
-            avoid = set()  # pas besoin de pair spécifique ici
+        for bloc in bloc_iter(semaines_hospit, bloc_semaines=2, bloc_semaines_alt=3):
+            avoid = titulaires_voisins(bloc, jours_hospit, ["Hospit1", "Hospit2"])
             m = choose_for_role(role, bloc, avoid, prio_key="Hospit")
             if m is None:
                 continue
@@ -298,12 +348,14 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
 
     # HDM: blocs 2 semaines (3 ou 1 si obligé)
     for role in ["HDM1","HDM2"]:
-        for bloc in bloc_iter(jours_ouvres, bloc_semaines=2, bloc_semaines_alt=3):
-            m = choose_for_role(role, bloc, avoid_pairs=set(), prio_key="HDM")
+        for bloc in bloc_iter(semaines_ouvrees, bloc_semaines=2, bloc_semaines_alt=3):
+            avoid = titulaires_voisins(bloc, jours_ouvres, ["HDM1", "HDM2"])
+            m = choose_for_role(role, bloc, avoid_pairs=avoid, prio_key="HDM")
             if m is None:
                 # tenter bloc plus court (1 semaine) si tout bloque
-                bloc_short = bloc[:5] if len(bloc) >= 5 else bloc
-                m = choose_for_role(role, bloc_short, avoid_pairs=set(), prio_key="HDM")
+                bloc_short = [d for d in bloc if semaine_de[d] == semaine_de[bloc[0]]]
+                avoid = titulaires_voisins(bloc_short, jours_ouvres, ["HDM1", "HDM2"])
+                m = choose_for_role(role, bloc_short, avoid_pairs=avoid, prio_key="HDM")
                 if m is None:
                     continue
                 bloc_to_use = bloc_short
@@ -346,6 +398,8 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
                 continue
             candidats = []
             for m in libres:
+                if m in used_per_day[js]:  # déjà posé sur HDL1 ou cumul HDM
+                    continue
                 # check séparation avec les rôles déjà posés (Hospit*, HDM*, HDL*)
                 deja = []
                 for r in ["Hospit1","Hospit2","HDL1","HDL2","HDM1","HDM2"]:
@@ -377,6 +431,135 @@ def assign_roles_smart(start_date, weeks=52, seed=42):
     with open(DATA_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
 
+def validate_planning(data):
+    # Contrôle des règles dures sur tout l'horizon de data['planning'] (généré, modifié ou importé).
+    # Retourne un DataFrame (Règle, Date, Médecin, Détail), vide si tout est respecté.
+    colonnes = ["Règle", "Date", "Médecin", "Détail"]
+    ROLES_JOUR = ["Hospit1", "Hospit2", "HDL1", "HDL2", "HDM1", "HDM2"]
+    BLOCS = {"Hospit": (["Hospit1", "Hospit2"], 2, 3), "HDM": (["HDM1", "HDM2"], 1, 3)}  # en semaines
+
+    # --- Affectations à plat : une ligne par (jour, rôle, médecin) ---
+    lignes = []
+    for jour, roles in data.get('planning', {}).items():
+        for role, personne in roles.items():
+            for p in (personne if isinstance(personne, list) else [personne]):
+                if isinstance(p, str):
+                    lignes.append((jour, role, p))
+    violations = []
+    aff = pd.DataFrame(lignes, columns=["jour", "role", "nom"])
+    ts = pd.to_datetime(aff["jour"], format="%Y-%m-%d", errors="coerce")
+    # clés de date mal formées (planning modifié à la main ou importé) : signalées puis ignorées
+    for jour in aff.loc[ts.isna(), "jour"].unique():
+        violations.append(("date_invalide", jour, "", "clé de date invalide (attendu AAAA-MM-JJ)"))
+    aff, ts = aff[ts.notna()].reset_index(drop=True), ts[ts.notna()].reset_index(drop=True)
+    if aff.empty:
+        return pd.DataFrame(violations, columns=colonnes)
+    debut, fin = ts.min().date(), ts.max().date()
+    o0 = debut.toordinal()
+    cal = calendrier(debut, fin)
+    jour_semaine = cal["jour_semaine"].to_numpy()
+    n_jours = len(cal)
+
+    medecins = data.get('medecins', [])
+    noms = [m['nom'] for m in medecins]
+    noms += sorted(set(aff["nom"]) - set(noms))  # médecins supprimés mais encore au planning
+    code = {n: i for i, n in enumerate(noms)}
+    j = (ts - ts.min()).dt.days.to_numpy()
+    k = aff["nom"].map(code).to_numpy()
+    role = aff["role"].to_numpy()
+
+    def ajouter(regle, jours_idx, meds_idx, details):
+        for ji, mi, detail in zip(jours_idx, meds_idx, details):
+            violations.append((regle, str(date.fromordinal(o0 + int(ji))), noms[int(mi)], detail))
+
+    # Grille des rôles de semaine : slot × jour → code médecin (-1 si vide)
+    S = np.full((len(ROLES_JOUR), n_jours), -1)
+    for r, nom_role in enumerate(ROLES_JOUR):
+        sel = role == nom_role
+        S[r, j[sel]] = k[sel]
+
+    # --- Indisponibilités (vacances, dates interdites globales, WE interdits) ---
+    indispo = np.zeros((n_jours, len(noms)), dtype=bool)
+    we_interdit = np.zeros((n_jours, len(noms)), dtype=bool)
+    vac_bornes = []  # (médecin, début relatif, fin relative)
+    for i, m in enumerate(medecins):
+        for v in m.get('vacances', []):
+            a = datetime.strptime(v[0], "%Y-%m-%d").date().toordinal() - o0
+            b = datetime.strptime(v[1], "%Y-%m-%d").date().toordinal() - o0
+            vac_bornes.append((i, a, b))
+            indispo[max(a, 0):max(b + 1, 0), i] = True
+        for d in m.get("weekends_interdits", []):
+            a = datetime.strptime(d, "%Y-%m-%d").date().toordinal() - o0
+            we_interdit[max(a, 0):max(a + 2, 0), i] = True
+    interdits = np.array([datetime.strptime(di, "%Y-%m-%d").date().toordinal() - o0
+                          for di in data.get("dates_interdites_globales", [])], dtype=int)
+    interdits = interdits[(interdits >= 0) & (interdits < n_jours)]
+    indispo[interdits, :] = True
+
+    # --- 1) Un médecin au plus une fois par jour (cumul HDLk + HDMk autorisé, règle 5/4 présents) ---
+    cumul = np.zeros(len(aff), dtype=bool)
+    for hdl, hdm in (("HDL1", "HDM1"), ("HDL2", "HDM2")):
+        sel = role == hdl
+        cumul[sel] = S[ROLES_JOUR.index(hdm), j[sel]] == k[sel]
+    occ = np.zeros((n_jours, len(noms)), dtype=int)
+    np.add.at(occ, (j[~cumul], k[~cumul]), 1)
+    jj, mm = np.nonzero(occ > 1)
+    ajouter("doublon", jj, mm, [f"{n} rôles le même jour" for n in occ[jj, mm]])
+
+    # --- 2) Personne pendant ses vacances / dates interdites / WE interdits ---
+    travaille = occ > 0
+    jj, mm = np.nonzero(travaille & indispo)
+    ajouter("indisponible", jj, mm, ["affecté pendant une indisponibilité"] * len(jj))
+    jj, mm = np.nonzero(travaille & we_interdit)
+    ajouter("weekend_interdit", jj, mm, ["affecté sur un week-end interdit"] * len(jj))
+
+    # --- 3) Week-ends travaillés : 14 jours minimum entre deux ---
+    we = jour_semaine[j] >= 5
+    samedi = j[we] - (jour_semaine[j[we]] - 5)  # index relatif du samedi (-1 si l'horizon commence un dimanche)
+    paires = np.unique(np.stack([k[we], samedi], axis=1), axis=0).reshape(-1, 2)  # trié par médecin puis samedi
+    ecart = np.diff(paires[:, 1])
+    bad = np.flatnonzero((paires[1:, 0] == paires[:-1, 0]) & (ecart < 14)) + 1
+    ajouter("espacement_we", paires[bad, 1], paires[bad, 0],
+            [f"{e} jours après le week-end précédent (minimum 14)" for e in ecart[bad - 1]])
+
+    # --- 4) Pas de week-end collé aux vacances : samedi ou dimanche = veille du départ / lendemain du retour ---
+    samedis_interdits = {(i, s) for i, a, b in vac_bornes for s in (a - 2, a - 1, b, b + 1)}
+    bad = np.flatnonzero(np.fromiter(((m, s) in samedis_interdits for m, s in paires.tolist()),
+                                     dtype=bool, count=len(paires)))
+    ajouter("we_encadrant_vacances", paires[bad, 1], paires[bad, 0],
+            ["week-end adjacent à une période de vacances"] * len(bad))
+
+    # --- 5) "separes" : jamais deux le même jour sur HDL/HDM/Hospit ---
+    sep = np.array([code[n] for n in data.get("separes", []) if n in code], dtype=int)
+    if len(sep):
+        presents_sep = (S[None, :, :] == sep[:, None, None]).any(axis=1)  # separé × jour
+        for ji in np.flatnonzero(presents_sep.sum(axis=0) >= 2):
+            qui = [noms[c] for c in sep[presents_sep[:, ji]]]
+            violations.append(("separes", str(date.fromordinal(o0 + int(ji))), ", ".join(qui),
+                               "médecins séparés affectés le même jour"))
+
+    # --- 6) Longueur des blocs Hospit / HDM, par médecin (Hospit1 → Hospit2 d'affilée = un seul bloc) ---
+    # Hospit couvre aussi les fériés de semaine ; HDM ne compte que les jours ouvrés
+    for famille, (roles_famille, mini, maxi) in BLOCS.items():
+        jours_role = cal["jour_semaine"] < 5 if famille == "Hospit" else cal["ouvre"]
+        ouvres = np.flatnonzero(jours_role.to_numpy())
+        if not len(ouvres):
+            continue
+        semaine = (o0 + ouvres - jour_semaine[ouvres]) // 7
+        grille = S[[ROLES_JOUR.index(r) for r in roles_famille]][:, ouvres]  # slot × jour
+        tient = (grille[:, :, None] == np.arange(len(noms))).any(axis=0)    # jour × médecin
+        bascule = np.diff(np.pad(tient, ((1, 1), (0, 0))).astype(int), axis=0).T
+        mm, debut_run = np.nonzero(bascule == 1)   # triés par médecin puis jour
+        _, fin_run = np.nonzero(bascule == -1)
+        fin_run = fin_run - 1
+        nb_sem = semaine[fin_run] - semaine[debut_run] + 1
+        bord = (debut_run == 0) | (fin_run == len(ouvres) - 1)  # bloc tronqué par l'horizon
+        bad = (nb_sem > maxi) | ((nb_sem < mini) & ~bord)
+        ajouter(f"bloc_{famille.lower()}", ouvres[debut_run[bad]], mm[bad],
+                [f"{famille} : bloc de {n} semaine(s) (attendu {mini} à {maxi})" for n in nb_sem[bad]])
+
+    return pd.DataFrame(violations, columns=colonnes).sort_values(by=["Date", "Règle"], ignore_index=True)
+
 def ajouter_vacances(med, new_start, new_end, depart, retour):
     # Vérification chevauchement
     overlap = False
@@ -597,17 +780,21 @@ def render_calendar(start_date, months=12):
     </style>
     """, unsafe_allow_html=True)
 
+    # Horizon : du 1er du mois de départ au dernier jour du dernier mois affiché
+    debut = start_date.replace(day=1)
+    fin_mois = (start_date.month + months - 1) % 12 + 1
+    fin_annee = start_date.year + ((start_date.month + months - 1) // 12)
+    fin = date(fin_annee, fin_mois, 1) - timedelta(days=1)
+    cal = calendrier(debut, fin)
+
     html = ""
-    for m in range(months):
-        current_month = (start_date.month + m - 1) % 12 + 1
-        current_year = start_date.year + ((start_date.month + m - 1) // 12)
-        first_day = date(current_year, current_month, 1)
+    for (current_year, current_month), jours_mois in cal.groupby(["annee", "mois"], sort=True):
         html += f"<h4>{mois_fr[current_month - 1].capitalize()} {current_year}</h4>"
         html += "<table><tr>" + ''.join(f"<th>{j.capitalize()}</th>" for j in jours_fr) + "</tr><tr>"
-        start_weekday = first_day.weekday()
+        start_weekday = int(jours_mois["jour_semaine"].iloc[0])
         html += "<td></td>" * start_weekday
-        day = first_day
-        while day.month == current_month:
+        for day, num, weekday, ferie_nom in zip(jours_mois["date"], jours_mois["jour"],
+                                                jours_mois["jour_semaine"], jours_mois["ferie_nom"]):
             jour_str = str(day)
             entries = []
             if jour_str in data['planning']:
@@ -620,11 +807,11 @@ def render_calendar(start_date, months=12):
                         color = couleur_pour_nom(name)
                         entries.append(f"<div style='color:{color};'>{name} ({role})</div>")
             height = 20 + 14 * len(entries)
-            cell_html = f"<div class='cell-wrapper' style='height:{height}px;'><div class='day-number'>{day.day}</div><div class='cell-content'>{''.join(entries)}</div></div>"
+            label = f"{num} · {ferie_nom}" if ferie_nom else f"{num}"
+            cell_html = f"<div class='cell-wrapper' style='height:{height}px;'><div class='day-number'>{label}</div><div class='cell-content'>{''.join(entries)}</div></div>"
             html += f"<td>{cell_html}</td>"
-            if day.weekday() == 6:
+            if weekday == 6:
                 html += "</tr><tr>"
-            day += timedelta(days=1)
         html += "</tr></table><br>"
     st.markdown(html, unsafe_allow_html=True)
     with open(DATA_FILE, "w", encoding="utf-8") as f:
@@ -648,6 +835,19 @@ if c3.button("📅 12 mois"):
     assign_roles_smart(today, weeks=52)   # ≈ 12 mois
     render_calendar(today, months=12)
 
+# Contrôle des règles dures sur le planning courant
+st.markdown("---")
+st.subheader("✅ Contrôle du planning")
+try:
+    violations = validate_planning(data)
+except Exception as e:  # données de vacances / dates interdites mal formées
+    st.error(f"⚠️ Contrôle impossible : {e}")
+    violations = None
+if violations is not None and not violations.empty:
+    st.warning(f"⚠️ {len(violations)} violation(s) détectée(s).")
+    st.dataframe(violations, hide_index=True)
+elif violations is not None and data['planning']:
+    st.success("✅ Toutes les règles sont respectées.")
 
 # Transformer le planning en DataFrame
 planning_liste = []
@@ -0,0 +1,143 @@
+import copy
+import importlib
+import json
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+import pytest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DONNEES = {
+    "dates_interdites_globales": [],
+    "separes": ["M1", "M2", "M3"],
+    "medecins": [{"nom": f"M{i}", "vacances": []} for i in range(7)],
+    "planning": {"2026-10-19": {"HDL1": "M0"}},
+}
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    # L'application s'exécute à l'import : on la charge dans un dossier de données jetable
+    dossier = tmp_path_factory.mktemp("donnees")
+    (dossier / "medecins_data.json").write_text(json.dumps(DONNEES), encoding="utf-8")
+    cwd = os.getcwd()
+    os.chdir(dossier)
+    sys.path.insert(0, RACINE)
+    try:
+        yield importlib.import_module("streamlit_app")
+    finally:
+        sys.path.remove(RACINE)
+        os.chdir(cwd)
+
+
+@pytest.fixture
+def data(app):
+    app.data.clear()
+    app.data.update(copy.deepcopy(DONNEES))
+    return app.data
+
+
+def test_calendrier_feries_et_periodes(app):
+    cal = app.calendrier(date(2026, 1, 1), date(2026, 12, 31)).set_index("date")
+    assert cal.loc[date(2026, 5, 14), "ferie_nom"] == "Ascension"
+    assert not cal.loc[date(2026, 11, 11), "ouvre"]
+    assert (cal.loc[date(2026, 4, 20), "periode"], cal.loc[date(2026, 4, 20), "periode_annee"]) == ("B", 2025)
+    assert (cal.loc[date(2026, 4, 21), "periode"], cal.loc[date(2026, 4, 21), "periode_annee"]) == ("A", 2026)
+
+
+def test_feries_couverts_en_hospit(app, data):
+    app.assign_roles_smart(date(2026, 10, 21), weeks=52)
+    for jour in ["2026-11-11", "2026-12-25", "2027-01-01", "2027-05-06", "2027-07-14"]:
+        roles = data["planning"][jour]
+        assert {"Hospit1", "Hospit2"} <= set(roles)
+        assert "HDL1" not in roles and "HDM1" not in roles
+
+
+@pytest.mark.parametrize("debut, semaines", [(date(2026, 10, 21), 52), (date(2026, 1, 5), 52 * 6)])
+def test_planning_genere_sans_violation(app, data, debut, semaines):
+    data["medecins"][0]["vacances"] = [["2026-12-01", "2026-12-10", "Matin", "Soir"]]
+    app.assign_roles_smart(debut, weeks=semaines)
+    violations = app.validate_planning(data)
+    assert violations.empty, violations.to_string()
+
+
+def test_vacances_hors_horizon_sans_collision(app, data):
+    # Horizon de 364 jours : l'ancienne clé entière de M1 retombait sur le samedi 2026-12-26 de M0
+    data["medecins"][1]["vacances"] = [["2025-12-18", "2025-12-25", "Matin", "Soir"]]
+    data["planning"] = {
+        "2026-10-19": {"HDL1": "M2"},
+        "2026-12-26": {"HDL_Samedi": "M0"},
+        "2027-10-17": {"Hospit_Dimanche": "M3"},
+    }
+    assert app.validate_planning(data).empty
+
+
+def test_violations_detectees(app, data):
+    data["medecins"][0]["vacances"] = [["2026-11-30", "2026-12-04", "Matin", "Soir"]]  # lundi → vendredi
+    data["dates_interdites_globales"] = ["2026-11-18"]
+    data["planning"] = {
+        "2026-11-16": {"HDL1": "M4", "HDL2": "M4", "HDM1": "M1", "HDM2": "M2"},
+        "2026-11-18": {"HDL1": "M5"},
+        "2026-11-21": {"HDL_Samedi": "M5"},
+        "2026-11-28": {"HDL_Samedi": "M5", "Hospit_Samedi": "M0"},
+        "2026-12-01": {"HDL1": "M0"},
+    }
+    regles = set(app.validate_planning(data)["Règle"])
+    assert regles == {"doublon", "separes", "indisponible", "espacement_we", "we_encadrant_vacances"}
+
+
+def test_bloc_trop_long(app, data):
+    jours = app.calendrier(date(2026, 11, 2), date(2026, 11, 27))
+    data["planning"] = {str(d): {"Hospit1": "M0"} for d in jours.loc[jours["jour_semaine"] < 5, "date"]}
+    data["planning"]["2026-10-30"] = {"Hospit1": "M1"}
+    data["planning"]["2026-11-30"] = {"Hospit1": "M1"}
+    violations = app.validate_planning(data)
+    assert list(violations["Règle"]) == ["bloc_hospit"]
+    assert violations.loc[0, "Médecin"] == "M0"
+
+
+def test_we_encadrant_vacances_lundi_vendredi(app, data):
+    data["medecins"][0]["vacances"] = [["2026-11-30", "2026-12-04", "Matin", "Soir"]]
+    data["planning"] = {
+        "2026-11-28": {"HDL_Samedi": "M0"},
+        "2026-12-05": {"Hospit_Samedi": "M0"},
+        "2026-12-06": {"Hospit_Dimanche": "M0"},
+    }
+    violations = app.validate_planning(data)
+    encadrants = violations.loc[violations["Règle"] == "we_encadrant_vacances", "Date"]
+    assert list(encadrants) == ["2026-11-28", "2026-12-05"]
+
+
+def test_bloc_par_medecin_sur_les_deux_slots(app, data):
+    # M0 enchaîne Hospit1 puis Hospit2 : un seul bloc de 4 semaines
+    jours = app.calendrier(date(2026, 11, 2), date(2026, 11, 27))
+    semaine = jours.loc[jours["jour_semaine"] < 5, "date"]
+    data["planning"] = {str(d): {"Hospit1" if d.day < 16 else "Hospit2": "M0"} for d in semaine}
+    data["planning"]["2026-10-30"] = {"Hospit1": "M1"}
+    data["planning"]["2026-11-30"] = {"Hospit1": "M1"}
+    violations = app.validate_planning(data)
+    assert list(violations["Règle"]) == ["bloc_hospit"]
+    assert violations.loc[0, "Détail"].startswith("Hospit : bloc de 4 semaine(s)")
+
+
+def test_planning_genere_blocs_par_medecin(app, data):
+    app.assign_roles_smart(date(2026, 10, 21), weeks=52)
+    hospit = pd.DataFrame([(jour, nom) for jour, roles in data["planning"].items()
+                           for r, nom in roles.items() if r in ("Hospit1", "Hospit2")],
+                          columns=["jour", "nom"])
+    jours = app.calendrier(date(2026, 10, 21), date(2027, 10, 19))
+    semaine = [str(d) for d in jours.loc[jours["jour_semaine"] < 5, "date"]]
+    for nom, sien in hospit.groupby("nom"):
+        tient = pd.Series(semaine).isin(set(sien["jour"]))
+        runs = tient.groupby((~tient).cumsum()).sum()
+        assert runs.max() <= 15, nom  # 3 semaines de lundi à vendredi
+
+
+def test_date_invalide(app, data):
+    data["planning"] = {"2026-10-19 ": {"HDL1": "M0"}, "2026-10-20": {"HDL1": "M1"}}
+    violations = app.validate_planning(data)
+    assert list(violations["Règle"]) == ["date_invalide"]
+    assert violations.loc[0, "Date"] == "2026-10-19 "